@@ -1,17 +1,94 @@
+import functools
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from bsm_model import BlackScholes
+from bsm_model import BlackScholes, compute_metric
 from gui_view import OptionAnalyticsUI
 
+def _load_kernel():
+    """
+    Imports the Numba-compiled kernels, which also loads/warms them up.
+    They are optional: without numba, or if they fail to load or compile,
+    the NumPy model is used instead.
+    Returns (bsm_kernel module or None, error message or None).
+    """
+    try:
+        import numba
+    except ImportError:
+        return None, None
+
+    # This runs on the analysis worker thread, so the warm-up starts Numba's parallel
+    # pool off the main thread. A TBB pool started that way keeps the process from
+    # exiting, so prefer OpenMP / workqueue (NUMBA_THREADING_LAYER still overrides this).
+    numba.config.THREADING_LAYER_PRIORITY = ['omp', 'workqueue', 'tbb']
+
+    try:
+        import bsm_kernel
+    except Exception as e:
+        return None, str(e)
+    return bsm_kernel, None
+
+@functools.lru_cache(maxsize=32)
+def _sweep_metric(grid_key, metric_key, kernel):
+    """
+    Evaluates one metric over the sensitivity grid (5 curves x N steps).
+    grid_key is (base_items, x_var_name, z_var_name, x_start, x_end, x_steps, z_start, z_inc),
+    where base_items is a frozenset of the non-swept base inputs; kernel is the
+    bsm_kernel module, or None to use the NumPy model.
+    Memoized, so repeat clicks and switching back to an earlier Y metric are instant;
+    the returned arrays are read-only since they are shared through the cache.
+    Returns (x_values, z_values, y_matrix).
+    """
+    base_items, x_var_name, z_var_name, x_start, x_end, x_steps, z_start, z_inc = grid_key
+
+    # Generate Vectors (single precision is plenty for plotting)
+    x_values = np.linspace(x_start, x_end, x_steps, dtype=np.float32)
+    z_values = (z_start + np.arange(5) * z_inc).astype(np.float32)
+
+    # Broadcast X along columns and Z along rows (5 curves x N steps)
+    kwargs = {k: np.float32(v) for k, v in base_items}
+    kwargs[x_var_name] = x_values[np.newaxis, :]
+    kwargs[z_var_name] = z_values[:, np.newaxis]
+
+    # Convert to model units (T in years, rates as decimals)
+    S, K = kwargs['S'], kwargs['K']
+    T = kwargs['T'] / 365.0
+    r = kwargs['r'] / 100.0
+    sigma = kwargs['sigma'] / 100.0
+    q = kwargs['q'] / 100.0
+
+    # Calculate the whole grid in a single vectorized call
+    if kernel is not None:
+        # The ufunc writes straight into a preallocated, contiguous (5 x N) buffer
+        y_matrix = np.empty((z_values.size, x_values.size), dtype=np.float32)
+        kernel.evaluate_metric(metric_key, S, K, T, r, sigma, q, out=y_matrix)
+    else:
+        # Metric-specific kernel: only the terms this metric needs
+        y_matrix = compute_metric(metric_key, S, K, T, r, sigma, q)
+
+    for arr in (x_values, z_values, y_matrix):
+        arr.setflags(write=False)
+    return x_values, z_values, y_matrix
+
 class OptionAnalyticsApp:
     """
     Controller class.
     Mediates between the View (OptionAnalyticsUI) and the Model (BlackScholes).
     """
+    POLL_MS = 20 # How often the Tk loop checks on a running analysis
+
     def __init__(self):
         self.root = tk.Tk()
         self.view = OptionAnalyticsUI(self.root)
         
+        # Single worker thread for the sensitivity analysis
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        
+        # Load the kernels in the background so the window paints first; being the
+        # first job on the single worker, it always finishes before any analysis
+        self.kernel_future = self.executor.submit(_load_kernel)
+        self.kernel_error_reported = False
+        
         # Bind Buttons
         self.view.btn_calc.config(command=self.run_dashboard_calc)
         self.view.btn_graph.config(command=self.run_analysis)
@@ -57,7 +134,11 @@ class OptionAnalyticsApp:
         )
         
         # Compute
-        results = model.calculate_all()
+        try:
+            results = model.calculate_all()
+        except ValueError as e:
+            tk.messagebox.showerror("Calculation Error", f"Could not price the option: {e}")
+            return
         
         # Update View
         self.view.update_dashboard_results(results)
@@ -81,46 +162,53 @@ class OptionAnalyticsApp:
             tk.messagebox.showwarning("Configuration Error", "X-Axis and Z-Axis variables must be different.")
             return
 
-        # Generate Vectors
-        x_values = np.linspace(params['x_start'], params['x_end'], params['x_steps'])
-        z_values = [params['z_start'] + i * params['z_inc'] for i in range(5)]
-        
-        # Result Matrix (5 curves x N steps)
-        y_matrix = []
-
-        # Simulation Loop
-        for z_val in z_values:
-            row_results = []
-            for x_val in x_values:
-                # Copy base inputs to avoid mutating original
-                current_inputs = base_inputs.copy()
-                
-                # Override with current X and Z
-                current_inputs[x_var_name] = x_val
-                current_inputs[z_var_name] = z_val
-                
-                # Calculate
-                model = BlackScholes(
-                    S=current_inputs['S'],
-                    K=current_inputs['K'],
-                    T_days=current_inputs['T'],
-                    r_pct=current_inputs['r'],
-                    sigma_pct=current_inputs['sigma'],
-                    q_pct=current_inputs['q']
-                )
-                res = model.calculate_all()
-                
-                # Extract specific metric
-                # Special handling for Theta/Rho if user wants Put specific? 
-                # The prompt asks for generic "Theta", usually Call Theta or they are close/same structure.
-                # Let's refine the metric map lookup if needed.
-                val = res.get(y_metric_key, 0.0)
-                
-                # If user selected "Theta" but we mapped to "call_theta", that's fine.
-                # If user selected "Put Price", we mapped to "put_price".
-                
-                row_results.append(val)
-            y_matrix.append(row_results)
+        # Compute off the Tk thread; NumPy/SciPy and the Numba kernels release the GIL
+        self.view.btn_graph.config(state='disabled', text="Computing...")
+        future = self.executor.submit(self._compute_analysis, base_inputs, params, x_var_name, z_var_name, y_metric_key)
+        self.root.after(self.POLL_MS, self._finish_analysis, future, params)
+
+    def _compute_analysis(self, base_inputs, params, x_var_name, z_var_name, y_metric_key):
+        """
+        Evaluates the sensitivity grid (runs on the worker thread).
+        Returns (x_values, z_values, y_matrix).
+        """
+        # The swept variables are overwritten by the grid, so leave them out of the key
+        base_items = frozenset(
+            (k, v) for k, v in base_inputs.items() if k not in (x_var_name, z_var_name)
+        )
+        grid_key = (
+            base_items, x_var_name, z_var_name,
+            params['x_start'], params['x_end'], params['x_steps'],
+            params['z_start'], params['z_inc']
+        )
+        kernel, _ = self.kernel_future.result()
+        return _sweep_metric(grid_key, y_metric_key, kernel)
+
+    def _report_kernel_error(self):
+        """
+        Tells the user (once) that the Numba kernels failed to load and the NumPy model is used.
+        """
+        if self.kernel_error_reported: return
+        _, error = self.kernel_future.result()
+        if error:
+            self.kernel_error_reported = True
+            tk.messagebox.showwarning("Numba Kernels Unavailable", f"Using the NumPy model instead: {error}")
+
+    def _finish_analysis(self, future, params):
+        """
+        Polls the worker from the Tk event loop and plots once it is done.
+        """
+        if not future.done():
+            self.root.after(self.POLL_MS, self._finish_analysis, future, params)
+            return
+
+        self.view.btn_graph.config(state='normal', text="Generate Graph")
+        self._report_kernel_error()
+        try:
+            x_values, z_values, y_matrix = future.result()
+        except Exception as e:
+            tk.messagebox.showerror("Calculation Error", f"Could not generate graph: {e}")
+            return
 
         # Plot
         self.view.plot_data(
@@ -0,0 +1,158 @@
+import math
+import numpy as np
+from numba import njit, vectorize, float32, float64, int8
+
+INV_SQRT_2PI = 0.3989422804014327 # 1 / sqrt(2 * pi)
+
+# Signatures shared by every kernel: (S, K, T, r, q, sigma, flag)
+# flag selects the option side: 0 = Call, 1 = Put
+KERNEL_SIGNATURES = [
+    float32(float32, float32, float32, float32, float32, float32, int8),
+    float64(float64, float64, float64, float64, float64, float64, int8)
+]
+
+CALL = 0
+PUT = 1
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _ndtr_approx(x):
+    """
+    Standard Normal CDF using the Abramowitz & Stegun 26.2.17 rational approximation.
+    Absolute error is below 7.5e-8, which is plenty for plotting.
+    """
+    ax = abs(x)
+    t = 1.0 / (1.0 + 0.2316419 * ax)
+    poly = t * (0.319381530 + t * (-0.356563782 + t * (1.781477937 + t * (-1.821255978 + t * 1.330274429))))
+    tail = INV_SQRT_2PI * math.exp(-0.5 * ax * ax) * poly
+    sign = 1.0 if x >= 0.0 else -1.0
+    return 0.5 * (1.0 + sign * (1.0 - 2.0 * tail))
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _npdf(x):
+    """Standard Normal PDF."""
+    return INV_SQRT_2PI * math.exp(-0.5 * x * x)
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _is_intrinsic(T, sigma):
+    """Expiration or Zero Volatility: only the intrinsic value is left."""
+    return T <= 1e-9 or sigma <= 1e-9
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _d1_d2(S, K, T, r, q, sigma):
+    """Calculate d1 and d2 parameters."""
+    sig_sqrtT = sigma * math.sqrt(T)
+    d1 = (math.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / sig_sqrtT
+    return d1, d1 - sig_sqrtT
+
+@vectorize(KERNEL_SIGNATURES, target='parallel', cache=True)
+def bs_price(S, K, T, r, q, sigma, flag):
+    """Theoretical option price."""
+    if _is_intrinsic(T, sigma):
+        return max(0.0, S - K) if flag == CALL else max(0.0, K - S)
+    d1, d2 = _d1_d2(S, K, T, r, q, sigma)
+    if flag == CALL:
+        return S * math.exp(-q * T) * _ndtr_approx(d1) - K * math.exp(-r * T) * _ndtr_approx(d2)
+    return K * math.exp(-r * T) * _ndtr_approx(-d2) - S * math.exp(-q * T) * _ndtr_approx(-d1)
+
+@vectorize(KERNEL_SIGNATURES, target='parallel', cache=True)
+def bs_delta(S, K, T, r, q, sigma, flag):
+    """Option delta."""
+    if T <= 1e-9:
+        # Deltas at expiration
+        if flag == CALL:
+            return 1.0 if S > K else 0.0
+        return -1.0 if S < K else 0.0
+    if sigma <= 1e-9:
+        return 0.0
+    d1, _ = _d1_d2(S, K, T, r, q, sigma)
+    if flag == CALL:
+        return math.exp(-q * T) * _ndtr_approx(d1)
+    return math.exp(-q * T) * (_ndtr_approx(d1) - 1.0)
+
+@vectorize(KERNEL_SIGNATURES, target='parallel', cache=True)
+def bs_gamma(S, K, T, r, q, sigma, flag):
+    """Option gamma (same for Call & Put)."""
+    if _is_intrinsic(T, sigma):
+        return 0.0
+    d1, _ = _d1_d2(S, K, T, r, q, sigma)
+    return math.exp(-q * T) * _npdf(d1) / (S * sigma * math.sqrt(T))
+
+@vectorize(KERNEL_SIGNATURES, target='parallel', cache=True)
+def bs_vega(S, K, T, r, q, sigma, flag):
+    """Option vega (same for Call & Put), per 1% change in volatility."""
+    if _is_intrinsic(T, sigma):
+        return 0.0
+    d1, _ = _d1_d2(S, K, T, r, q, sigma)
+    return S * math.exp(-q * T) * math.sqrt(T) * _npdf(d1) / 100.0
+
+@vectorize(KERNEL_SIGNATURES, target='parallel', cache=True)
+def bs_theta(S, K, T, r, q, sigma, flag):
+    """Option theta, per day."""
+    if _is_intrinsic(T, sigma):
+        return 0.0
+    d1, d2 = _d1_d2(S, K, T, r, q, sigma)
+    exp_mqT = math.exp(-q * T)
+    exp_mrT = math.exp(-r * T)
+    term1 = -(S * exp_mqT * _npdf(d1) * sigma) / (2.0 * math.sqrt(T))
+    if flag == CALL:
+        theta_yr = term1 - r * K * exp_mrT * _ndtr_approx(d2) + q * S * exp_mqT * _ndtr_approx(d1)
+    else:
+        theta_yr = term1 + r * K * exp_mrT * _ndtr_approx(-d2) - q * S * exp_mqT * _ndtr_approx(-d1)
+    return theta_yr / 365.0
+
+@vectorize(KERNEL_SIGNATURES, target='parallel', cache=True)
+def bs_rho(S, K, T, r, q, sigma, flag):
+    """Option rho, per 1% change in rates."""
+    if _is_intrinsic(T, sigma):
+        return 0.0
+    _, d2 = _d1_d2(S, K, T, r, q, sigma)
+    if flag == CALL:
+        return K * T * math.exp(-r * T) * _ndtr_approx(d2) / 100.0
+    return -K * T * math.exp(-r * T) * _ndtr_approx(-d2) / 100.0
+
+# Mapping of result keys (as returned by BlackScholes.calculate_all) to kernel + flag
+METRIC_KERNELS = {
+    'call_price': (bs_price, CALL),
+    'put_price': (bs_price, PUT),
+    'call_delta': (bs_delta, CALL),
+    'put_delta': (bs_delta, PUT),
+    'gamma': (bs_gamma, CALL),
+    'vega': (bs_vega, CALL),
+    'call_theta': (bs_theta, CALL),
+    'put_theta': (bs_theta, PUT),
+    'call_rho': (bs_rho, CALL),
+    'put_rho': (bs_rho, PUT)
+}
+
+def evaluate_metric(metric_key, S, K, T, r, sigma, q=0.0, out=None):
+    """
+    Evaluate a single metric over broadcastable arrays in one ufunc call.
+    Inputs are in model units (T in years, r/sigma/q as decimals), in the same
+    order as bsm_model.compute_metric; the kernels themselves take (..., q, sigma).
+    If given, out must be an array of the broadcast shape to write the result into.
+    """
+    kernel, flag = METRIC_KERNELS[metric_key]
+    return kernel(S, K, T, r, q, sigma, np.int8(flag), out=out)
+
+# Warm-up at import time, so the first "Generate Graph" click never pays for
+# compilation or parallel thread-pool start-up
+for _kernel in (bs_price, bs_delta, bs_gamma, bs_vega, bs_theta, bs_rho):
+    _kernel(100.0, 100.0, 1.0, 0.05, 0.0, 0.2, np.int8(CALL))
+
+if __name__ == "__main__":
+    # Cross-check the kernels against the scalar model (including expiry and zero vol)
+    from bsm_model import BlackScholes
+
+    spots = np.array([80.0, 100.0, 120.0])
+    vols = np.array([0.0, 20.0, 45.0])
+    days = np.array([0.0, 30.0, 365.0])
+    S, sigma, T = (a.ravel() for a in np.meshgrid(spots, vols, days))
+    scalar = [BlackScholes(s, 100, t, 5, v, 2).calculate_all() for s, v, t in zip(S, sigma, T)]
+    args = (S, 100.0, T / 365.0, 0.05, sigma / 100.0, 0.02)
+
+    max_err = 0.0
+    for key in METRIC_KERNELS:
+        expected = np.array([res[key] for res in scalar])
+        max_err = max(max_err, np.abs(evaluate_metric(key, *args) - expected).max())
+
+    print(f"evaluate_metric max abs error: {max_err:.2e} (Expected < 1e-4, A&S normal CDF)")
@@ -1,5 +1,201 @@
+from math import erf, exp, sqrt, log
 import numpy as np
-from scipy.stats import norm
+
+INV_SQRT_2PI = 0.3989422804014327 # 1 / sqrt(2 * pi)
+INV_SQRT_2 = 0.7071067811865476 # 1 / sqrt(2)
+
+def _Phi(x):
+    """Standard Normal CDF (scalar)"""
+    return 0.5 * (1.0 + erf(x * INV_SQRT_2))
+
+def _phi(x):
+    """Standard Normal PDF (scalar)"""
+    return INV_SQRT_2PI * exp(-0.5 * x * x)
+
+_ndtr = None
+
+def _get_ndtr():
+    """
+    Returns scipy.special.ndtr, importing SciPy on first use
+    so that importing this module stays cheap.
+    """
+    global _ndtr
+    if _ndtr is None:
+        from scipy.special import ndtr
+        _ndtr = ndtr
+    return _ndtr
+
+def _prepare(S, K, T, r, sigma, q):
+    """
+    Common input handling for the array functions below.
+    Returns the inputs as arrays (float32 stays float32, everything else becomes float64)
+    with T and sigma clamped away from zero, plus the expiry and intrinsic-value masks.
+    """
+    # Inputs are deliberately not broadcast up front: each intermediate keeps the
+    # shape of the inputs it depends on, so terms like e^(-rT) or sqrt(T) are
+    # computed once when T and r are not swept, instead of once per grid point
+    dtype = np.result_type(S, K, T, r, sigma, q, 1.0)
+    S = np.asarray(S, dtype=dtype)
+    K = np.asarray(K, dtype=dtype)
+    T = np.asarray(T, dtype=dtype)
+    r = np.asarray(r, dtype=dtype)
+    sigma = np.asarray(sigma, dtype=dtype)
+    q = np.asarray(q, dtype=dtype)
+
+    # Edge case: Expiration or Zero Volatility (intrinsic value only)
+    expired = T <= 1e-9
+    intrinsic = expired | (sigma <= 1e-9)
+
+    # Evaluate BSM everywhere, guarding against division by zero;
+    # the intrinsic entries are swapped in afterwards without branching
+    T = np.maximum(T, 1e-12)
+    sigma = np.maximum(sigma, 1e-12)
+
+    return S, K, T, r, sigma, q, expired, intrinsic
+
+def _d1_d2(S, K, T, r, sigma, q):
+    """Calculate d1 and d2 parameters (and sqrt(T) for reuse)."""
+    sqrt_T = np.sqrt(T)
+    sig_sqrtT = sigma * sqrt_T
+    d1 = (np.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / sig_sqrtT
+    return d1, d1 - sig_sqrtT, sqrt_T
+
+def compute_all(S, K, T, r, sigma, q=0.0):
+    """
+    Compute all option metrics (Price + Greeks) over NumPy arrays in a single broadcasted pass.
+    Inputs are in model units (T in years, r/sigma/q as decimals); any of them may be an array.
+    Returns a dictionary of arrays with the broadcast shape of the inputs.
+    Float32 inputs are computed in float32; everything else in float64.
+    """
+    S, K, T, r, sigma, q, expired, intrinsic = _prepare(S, K, T, r, sigma, q)
+
+    # Pre-compute common terms
+    d1, d2, sqrt_T = _d1_d2(S, K, T, r, sigma, q)
+    sig_sqrtT = sigma * sqrt_T
+    exp_mqT = np.exp(-q * T) # e^(-qT)
+    exp_mrT = np.exp(-r * T) # e^(-rT)
+
+    # One ndtr call over all four arguments amortizes the ufunc dispatch
+    N_d1, N_d2, N_neg_d1, N_neg_d2 = _get_ndtr()(np.stack([d1, d2, -d1, -d2]))
+    n_d1 = INV_SQRT_2PI * np.exp(-0.5 * d1 * d1) # Standard Normal PDF
+    sEqn = S * exp_mqT * n_d1 # Shared by Gamma, Vega and Theta
+
+    call_price = S * exp_mqT * N_d1 - K * exp_mrT * N_d2
+    put_price = K * exp_mrT * N_neg_d2 - S * exp_mqT * N_neg_d1
+    call_delta = exp_mqT * N_d1
+    put_delta = exp_mqT * (N_d1 - 1)
+    gamma = sEqn / (S * S * sig_sqrtT)
+    vega = sEqn * sqrt_T / 100.0
+
+    term1 = -(sEqn * sigma) / (2 * sqrt_T)
+    call_theta = (term1 - r * K * exp_mrT * N_d2 + q * S * exp_mqT * N_d1) / 365.0
+    put_theta = (term1 + r * K * exp_mrT * N_neg_d2 - q * S * exp_mqT * N_neg_d1) / 365.0
+
+    call_rho = K * T * exp_mrT * N_d2 / 100.0
+    put_rho = -K * T * exp_mrT * N_neg_d2 / 100.0
+
+    # Deltas at expiration: sign(S - K) gives {-1, 0, 1}
+    moneyness = np.sign(S - K)
+
+    # Blend in the intrinsic-value branch
+    return {
+        'call_price': np.where(intrinsic, np.maximum(S - K, 0.0), call_price),
+        'put_price': np.where(intrinsic, np.maximum(K - S, 0.0), put_price),
+        'call_delta': np.where(expired, np.maximum(moneyness, 0.0), np.where(intrinsic, 0.0, call_delta)),
+        'put_delta': np.where(expired, np.minimum(moneyness, 0.0), np.where(intrinsic, 0.0, put_delta)),
+        'gamma': np.where(intrinsic, 0.0, gamma),
+        'vega': np.where(intrinsic, 0.0, vega),
+        'call_theta': np.where(intrinsic, 0.0, call_theta),
+        'put_theta': np.where(intrinsic, 0.0, put_theta),
+        'call_rho': np.where(intrinsic, 0.0, call_rho),
+        'put_rho': np.where(intrinsic, 0.0, put_rho)
+    }
+
+# --- Per-metric kernels ---
+# Each computes only the terms its metric needs; inputs come from _prepare.
+
+def _call_price(S, K, T, r, sigma, q, expired, intrinsic):
+    d1, d2, _ = _d1_d2(S, K, T, r, sigma, q)
+    ndtr = _get_ndtr()
+    N_d1, N_d2 = ndtr(d1), ndtr(d2)
+    price = S * np.exp(-q * T) * N_d1 - K * np.exp(-r * T) * N_d2
+    return np.where(intrinsic, np.maximum(S - K, 0.0), price)
+
+def _put_price(S, K, T, r, sigma, q, expired, intrinsic):
+    d1, d2, _ = _d1_d2(S, K, T, r, sigma, q)
+    ndtr = _get_ndtr()
+    N_neg_d1, N_neg_d2 = ndtr(-d1), ndtr(-d2)
+    price = K * np.exp(-r * T) * N_neg_d2 - S * np.exp(-q * T) * N_neg_d1
+    return np.where(intrinsic, np.maximum(K - S, 0.0), price)
+
+def _call_delta(S, K, T, r, sigma, q, expired, intrinsic):
+    d1, _, _ = _d1_d2(S, K, T, r, sigma, q)
+    delta = np.exp(-q * T) * _get_ndtr()(d1)
+    return np.where(expired, np.maximum(np.sign(S - K), 0.0), np.where(intrinsic, 0.0, delta))
+
+def _put_delta(S, K, T, r, sigma, q, expired, intrinsic):
+    d1, _, _ = _d1_d2(S, K, T, r, sigma, q)
+    delta = np.exp(-q * T) * (_get_ndtr()(d1) - 1)
+    return np.where(expired, np.minimum(np.sign(S - K), 0.0), np.where(intrinsic, 0.0, delta))
+
+def _gamma(S, K, T, r, sigma, q, expired, intrinsic):
+    d1, _, sqrt_T = _d1_d2(S, K, T, r, sigma, q)
+    gamma = np.exp(-q * T) * INV_SQRT_2PI * np.exp(-0.5 * d1 * d1) / (S * sigma * sqrt_T)
+    return np.where(intrinsic, 0.0, gamma)
+
+def _vega(S, K, T, r, sigma, q, expired, intrinsic):
+    d1, _, sqrt_T = _d1_d2(S, K, T, r, sigma, q)
+    vega = S * np.exp(-q * T) * sqrt_T * INV_SQRT_2PI * np.exp(-0.5 * d1 * d1) / 100.0
+    return np.where(intrinsic, 0.0, vega)
+
+def _call_theta(S, K, T, r, sigma, q, expired, intrinsic):
+    d1, d2, sqrt_T = _d1_d2(S, K, T, r, sigma, q)
+    ndtr = _get_ndtr()
+    N_d1, N_d2 = ndtr(d1), ndtr(d2)
+    exp_mqT = np.exp(-q * T)
+    term1 = -(S * exp_mqT * INV_SQRT_2PI * np.exp(-0.5 * d1 * d1) * sigma) / (2 * sqrt_T)
+    theta = (term1 - r * K * np.exp(-r * T) * N_d2 + q * S * exp_mqT * N_d1) / 365.0
+    return np.where(intrinsic, 0.0, theta)
+
+def _put_theta(S, K, T, r, sigma, q, expired, intrinsic):
+    d1, d2, sqrt_T = _d1_d2(S, K, T, r, sigma, q)
+    ndtr = _get_ndtr()
+    N_neg_d1, N_neg_d2 = ndtr(-d1), ndtr(-d2)
+    exp_mqT = np.exp(-q * T)
+    term1 = -(S * exp_mqT * INV_SQRT_2PI * np.exp(-0.5 * d1 * d1) * sigma) / (2 * sqrt_T)
+    theta = (term1 + r * K * np.exp(-r * T) * N_neg_d2 - q * S * exp_mqT * N_neg_d1) / 365.0
+    return np.where(intrinsic, 0.0, theta)
+
+def _call_rho(S, K, T, r, sigma, q, expired, intrinsic):
+    _, d2, _ = _d1_d2(S, K, T, r, sigma, q)
+    rho = K * T * np.exp(-r * T) * _get_ndtr()(d2) / 100.0
+    return np.where(intrinsic, 0.0, rho)
+
+def _put_rho(S, K, T, r, sigma, q, expired, intrinsic):
+    _, d2, _ = _d1_d2(S, K, T, r, sigma, q)
+    rho = -K * T * np.exp(-r * T) * _get_ndtr()(-d2) / 100.0
+    return np.where(intrinsic, 0.0, rho)
+
+# Mapping of result keys (as returned by compute_all) to their kernels
+METRIC_FUNCTIONS = {
+    'call_price': _call_price,
+    'put_price': _put_price,
+    'call_delta': _call_delta,
+    'put_delta': _put_delta,
+    'gamma': _gamma,
+    'vega': _vega,
+    'call_theta': _call_theta,
+    'put_theta': _put_theta,
+    'call_rho': _call_rho,
+    'put_rho': _put_rho
+}
+
+def compute_metric(metric_key, S, K, T, r, sigma, q=0.0):
+    """
+    Compute a single option metric over NumPy arrays, doing only the work that metric needs.
+    Takes the same inputs as compute_all and returns the array compute_all would hold under metric_key.
+    """
+    return METRIC_FUNCTIONS[metric_key](*_prepare(S, K, T, r, sigma, q))
 
 class BlackScholes:
     """
@@ -23,22 +219,11 @@ class BlackScholes:
         self.sigma = float(sigma_pct) / 100.0
         self.q = float(q_pct) / 100.0
 
-    def _d1_d2(self):
-        """
-        Calculate d1 and d2 parameters.
-        Handles edge cases where T or sigma is close to zero.
-        """
-        if self.T <= 1e-9 or self.sigma <= 1e-9:
-            return None, None
-        
-        d1 = (np.log(self.S / self.K) + (self.r - self.q + 0.5 * self.sigma ** 2) * self.T) / (self.sigma * np.sqrt(self.T))
-        d2 = d1 - self.sigma * np.sqrt(self.T)
-        return d1, d2
-
     def calculate_all(self):
         """
         Compute all option metrics (Price + Greeks).
         Returns a dictionary.
+        Scalar path for a single option, using math.erf; see compute_all for arrays.
         """
         results = {
             'call_price': 0.0, 'put_price': 0.0,
@@ -62,22 +247,33 @@ class BlackScholes:
                 results['put_delta'] = -1.0
             return results
 
-        d1, d2 = self._d1_d2()
-        if d1 is None: # Should be covered by T check, but safety for sigma=0
-             results['call_price'] = max(0.0, self.S - self.K)
-             results['put_price'] = max(0.0, self.K - self.S)
-             return results
+        # Zero Volatility: no time value left
+        if self.sigma <= 1e-9:
+            results['call_price'] = max(0.0, self.S - self.K)
+            results['put_price'] = max(0.0, self.K - self.S)
+            return results
+
+        # log(S/K) below is only defined for positive prices
+        if self.S <= 0 or self.K <= 0:
+            raise ValueError("Spot and Strike prices must be positive")
 
         # Pre-compute common terms
-        sqrt_T = np.sqrt(self.T)
-        exp_mqT = np.exp(-self.q * self.T) # e^(-qT)
-        exp_mrT = np.exp(-self.r * self.T) # e^(-rT)
-        
-        N_d1 = norm.cdf(d1)
-        N_d2 = norm.cdf(d2)
-        N_neg_d1 = norm.cdf(-d1)
-        N_neg_d2 = norm.cdf(-d2)
-        n_d1 = norm.pdf(d1) # Standard Normal PDF
+        sqrt_T = sqrt(self.T)
+        sig_sqrtT = self.sigma * sqrt_T
+        log_SK = log(self.S / self.K)
+        drift = (self.r - self.q + 0.5 * self.sigma * self.sigma) * self.T
+        exp_mqT = exp(-self.q * self.T) # e^(-qT)
+        exp_mrT = exp(-self.r * self.T) # e^(-rT)
+
+        d1 = (log_SK + drift) / sig_sqrtT
+        d2 = d1 - sig_sqrtT
+
+        N_d1 = _Phi(d1)
+        N_d2 = _Phi(d2)
+        N_neg_d1 = _Phi(-d1)
+        N_neg_d2 = _Phi(-d2)
+        n_d1 = _phi(d1) # Standard Normal PDF
+        sEqn = self.S * exp_mqT * n_d1 # Shared by Gamma, Vega and Theta
 
         # Prices
         results['call_price'] = self.S * exp_mqT * N_d1 - self.K * exp_mrT * N_d2
@@ -88,28 +284,24 @@ class BlackScholes:
         results['put_delta'] = exp_mqT * (N_d1 - 1)
 
         # Gamma (Same for Call & Put)
-        results['gamma'] = (exp_mqT * n_d1) / (self.S * self.sigma * sqrt_T)
+        results['gamma'] = sEqn / (self.S * self.S * sig_sqrtT)
 
         # Vega (Same for Call & Put) - Display as change per 1% vol
-        raw_vega = self.S * exp_mqT * sqrt_T * n_d1
-        results['vega'] = raw_vega / 100.0
+        results['vega'] = sEqn * sqrt_T / 100.0
 
         # Theta (Annual)
-        term1 = -(self.S * exp_mqT * n_d1 * self.sigma) / (2 * sqrt_T)
-        
+        term1 = -(sEqn * self.sigma) / (2 * sqrt_T)
+
         call_theta_yr = term1 - self.r * self.K * exp_mrT * N_d2 + self.q * self.S * exp_mqT * N_d1
         put_theta_yr = term1 + self.r * self.K * exp_mrT * N_neg_d2 - self.q * self.S * exp_mqT * N_neg_d1
-        
+
         # Convert to Daily Theta
         results['call_theta'] = call_theta_yr / 365.0
         results['put_theta'] = put_theta_yr / 365.0
 
         # Rho - Display as change per 1% rate
-        raw_call_rho = self.K * self.T * exp_mrT * N_d2
-        raw_put_rho = -self.K * self.T * exp_mrT * N_neg_d2
-        
-        results['call_rho'] = raw_call_rho / 100.0
-        results['put_rho'] = raw_put_rho / 100.0
+        results['call_rho'] = self.K * self.T * exp_mrT * N_d2 / 100.0
+        results['put_rho'] = -self.K * self.T * exp_mrT * N_neg_d2 / 100.0
 
         return results
 
@@ -122,3 +314,21 @@ if __name__ == "__main__":
     print(f"Call Price: {res['call_price']:.4f} (Expected ~10.45)")
     print(f"Put Price:  {res['put_price']:.4f} (Expected ~5.57)")
     print(f"Call Delta: {res['call_delta']:.4f} (Expected ~0.63)")
+
+    # Cross-check the array functions against calculate_all (including expiry and zero vol)
+    spots = np.array([80.0, 100.0, 120.0])
+    vols = np.array([0.0, 20.0, 45.0])
+    days = np.array([0.0, 30.0, 365.0])
+    S, sigma, T = (a.ravel() for a in np.meshgrid(spots, vols, days))
+    scalar = [BlackScholes(s, 100, t, 5, v, 2).calculate_all() for s, v, t in zip(S, sigma, T)]
+    args = (S, 100.0, T / 365.0, 0.05, sigma / 100.0, 0.02)
+
+    all_metrics = compute_all(*args)
+    max_err = {'compute_all': 0.0, 'compute_metric': 0.0}
+    for key in METRIC_FUNCTIONS:
+        expected = np.array([res[key] for res in scalar])
+        max_err['compute_all'] = max(max_err['compute_all'], np.abs(all_metrics[key] - expected).max())
+        max_err['compute_metric'] = max(max_err['compute_metric'], np.abs(compute_metric(key, *args) - expected).max())
+
+    print(f"compute_all max abs error:    {max_err['compute_all']:.2e} (Expected < 1e-12)")
+    print(f"compute_metric max abs error: {max_err['compute_metric']:.2e} (Expected < 1e-12)")
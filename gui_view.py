@@ -1,7 +1,5 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from matplotlib.figure import Figure
 
 class OptionAnalyticsUI:
     """
@@ -165,11 +163,35 @@ class OptionAnalyticsUI:
         self.btn_graph = ttk.Button(frame_controls, text="Generate Graph")
         self.btn_graph.pack(side='left', padx=20, fill='y')
 
+        # The chart is built the first time this tab is shown, so the
+        # dashboard can paint without waiting for Matplotlib to import
+        self.canvas = None
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+
+    def _on_tab_changed(self, event):
+        if self.notebook.select() == str(self.tab_analysis):
+            self.setup_analysis_canvas()
+
+    def setup_analysis_canvas(self):
+        """Builds the Matplotlib chart of Tab 2 (once, on first use)"""
+        if self.canvas is not None: return
+
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+        from matplotlib.figure import Figure
+
         # Matplotlib Canvas
         self.fig = Figure(figsize=(5, 4), dpi=100)
         self.ax = self.fig.add_subplot(111)
+        self.ax.grid(True, linestyle='--', alpha=0.6)
+        
+        # Blitting state: curve handles, legend, static background and its decorations
+        self._lines = None
+        self._legend = None
+        self._bg = None
+        self._decorations = None
         
         self.canvas = FigureCanvasTkAgg(self.fig, master=self.tab_analysis)
+        self.canvas.mpl_connect('draw_event', self._on_canvas_draw)
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill='both', expand=True)
         
@@ -235,20 +257,66 @@ class OptionAnalyticsUI:
             messagebox.showerror("Input Error", f"Invalid graph settings: {e}")
             return None
 
+    def _on_canvas_draw(self, event):
+        """After every full redraw: grab the static background, then paint the curves and legend on top."""
+        if event.canvas is not self.canvas or self.canvas.is_saving():
+            # savefig renders on its own (possibly vector) canvas: paint the animated
+            # artists into that render, but keep the on-screen background untouched
+            for artist in self._animated_artists():
+                artist.draw(event.renderer)
+            return
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_animated()
+
+    def _animated_artists(self):
+        artists = list(self._lines or [])
+        if self._legend is not None:
+            artists.append(self._legend)
+        return artists
+
+    def _draw_animated(self):
+        for artist in self._animated_artists():
+            self.ax.draw_artist(artist)
+
     def plot_data(self, x_values, z_values, y_matrix, x_label, y_label, z_label):
-        """Renders the chart."""
-        self.ax.clear()
+        """
+        Renders the chart.
+        Only the curves and legend are re-blitted when the axis limits and labels
+        are unchanged; anything else falls back to a full redraw.
+        """
+        self.setup_analysis_canvas()
         
-        colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
+        # Curves and legend are animated artists, so full redraws leave them to _on_canvas_draw
+        if self._lines is None:
+            colors = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd']
+            self._lines = [self.ax.plot([], [], color=color, animated=True)[0] for color in colors]
         
-        for i, z_val in enumerate(z_values):
-            color = colors[i % len(colors)]
-            self.ax.plot(x_values, y_matrix[i], label=f"{z_label}={z_val:.2f}", color=color)
-            
+        labels = [f"{z_label}={z_val:.2f}" for z_val in z_values]
+        for line, row, label in zip(self._lines, y_matrix, labels):
+            line.set_data(x_values, row)
+            line.set_label(label)
+        
+        # The legend holds the Z values, so it is rebuilt every time
+        self._legend = self.ax.legend()
+        self._legend.set_animated(True)
+        
+        # The toolbar's zoom/pan tools switch autoscaling off; every new plot starts from the full view
+        old_limits = (self.ax.get_xlim(), self.ax.get_ylim())
+        self.ax.set_autoscale_on(True)
+        self.ax.relim()
+        self.ax.autoscale_view()
+        limits = (self.ax.get_xlim(), self.ax.get_ylim())
+        
+        decorations = (x_label, y_label)
+        if self._bg is not None and limits == old_limits and decorations == self._decorations:
+            self.canvas.restore_region(self._bg)
+            self._draw_animated()
+            self.canvas.blit(self.ax.bbox)
+            return
+        
+        self._decorations = decorations
         self.ax.set_xlabel(x_label)
         self.ax.set_ylabel(y_label)
         self.ax.set_title(f"{y_label} vs. {x_label}")
-        self.ax.legend()
-        self.ax.grid(True, linestyle='--', alpha=0.6)
         
         self.canvas.draw()